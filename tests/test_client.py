@@ -0,0 +1,253 @@
+"""Offline tests for the DDP client's local state, driven by raw DDP frames."""
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from toybox_api.client import ToyBoxClient
+from toybox_api.exceptions import ConnectionError
+
+
+class FakeWebSocket:
+    """Stands in for the aiohttp websocket: records frames, optionally replies."""
+
+    def __init__(self, client, reply=None):
+        self.client = client
+        self.reply = reply
+        self.closed = False
+        self.sent = []
+
+    async def send_str(self, data):
+        msg = json.loads(data)
+        self.sent.append(msg)
+        if self.reply:
+            response = self.reply(msg)
+            if response is not None:
+                # Delivered on a later loop iteration, like a real server reply
+                asyncio.get_running_loop().call_soon(
+                    self.client._handle_message, json.dumps(response)
+                )
+
+    async def close(self):
+        self.closed = True
+
+
+def connect(client, reply=None):
+    """Wire a client to a FakeWebSocket as if connect() had succeeded."""
+    client._ws = FakeWebSocket(client, reply)
+    client._loop = asyncio.get_running_loop()
+    client._connected = True
+    return client._ws
+
+
+def feed(client, msg, collection, doc_id, **extra):
+    client._handle_message(json.dumps(
+        {"msg": msg, "collection": collection, "id": doc_id, **extra}
+    ))
+
+
+def methods_sent(ws):
+    return [msg for msg in ws.sent if msg["msg"] == "method"]
+
+
+@pytest.fixture
+def client():
+    return ToyBoxClient()
+
+
+def test_print_request_cache_invalidation(client):
+    feed(client, "added", "toyPrints", "r1", fields={"printer_id": "p1", "state": "Printing"})
+    first = client.get_print_requests("p1")[0]
+    assert client.get_print_requests("p1")[0] is first
+
+    feed(client, "changed", "toyPrints", "r1", fields={"state": "paused"})
+    assert "r1" not in client._print_request_cache
+    second = client.get_print_requests("p1")[0]
+    assert second is not first
+    assert second.is_paused
+
+    feed(client, "changed", "toyPrints", "r1", cleared=["state"])
+    assert client.get_print_requests("p1")[0].state == "unknown"
+
+    feed(client, "removed", "toyPrints", "r1")
+    assert client._print_request_cache == {}
+    assert client.get_print_requests() == []
+
+
+def test_printer_status_cache_invalidation(client):
+    assert client.get_printer_status() is None
+
+    feed(client, "added", "PrinterStates", "p1", fields={"name": "Desk", "online": True})
+    status = client.get_printer_status("p1")
+    assert status.name == "Desk"
+    assert client.get_printer_status() is status
+
+    feed(client, "changed", "PrinterStates", "p1", fields={"online": False})
+    assert client.get_printer_status("p1") is not status
+    assert client.get_printer_status("p1").is_online is False
+
+    feed(client, "removed", "PrinterStates", "p1")
+    assert client.get_printer_status("p1") is None
+    assert client._printer_status_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_nosub_releases_subscription_waiter(client):
+    ws = connect(client, lambda msg: {"msg": "nosub", "id": msg["id"], "error": {}})
+
+    async with asyncio.timeout(1):
+        await client.subscribe("user-data-small", wait=True)
+
+    assert ws.sent[0]["msg"] == "sub"
+    assert client._pending_subs == {}
+
+
+def test_print_index_follows_printer_moves(client):
+    feed(client, "added", "toyPrints", "r1", fields={"printer_id": "p1", "state": "Printing"})
+    feed(client, "added", "toyPrints", "r2", fields={"printer_id": "p1", "state": "done"})
+    assert set(client._prints_by_printer["p1"]) == {"r1", "r2"}
+
+    feed(client, "changed", "toyPrints", "r1", fields={"printer_id": "p2"})
+    assert set(client._prints_by_printer["p1"]) == {"r2"}
+    assert set(client._prints_by_printer["p2"]) == {"r1"}
+    assert [r.id for r in client.get_print_requests("p2")] == ["r1"]
+
+    feed(client, "removed", "toyPrints", "r2")
+    assert "p1" not in client._prints_by_printer
+    assert client.get_print_requests("p1") == []
+
+
+def test_print_index_uses_resolved_collection_only(client):
+    feed(client, "added", "toyPrints", "r1", fields={"printer_id": "p1"})
+    feed(client, "added", "printRequests", "r2", fields={"printer_id": "p1"})
+
+    assert client._print_requests_key == "toyPrints"
+    assert set(client._prints_by_printer["p1"]) == {"r1"}
+    by_printer = {r.id for r in client.get_print_requests("p1")}
+    assert by_printer == {r.id for r in client.get_print_requests()}
+
+    feed(client, "removed", "printRequests", "r2")
+    assert set(client._prints_by_printer["p1"]) == {"r1"}
+
+
+def test_untracked_collections_dropped_by_default():
+    client = ToyBoxClient()
+    feed(client, "added", "printerQueues", "q1", fields={})
+    assert "printerQueues" not in client._collections
+
+    client = ToyBoxClient(track_all_collections=True)
+    feed(client, "added", "printerQueues", "q1", fields={"a": 1})
+    feed(client, "changed", "printerQueues", "q1", fields={"a": 2})
+    assert client._collections["printerQueues"]["q1"]["a"] == 2
+
+
+@pytest.mark.asyncio
+async def test_late_result_for_cancelled_call_is_ignored(client):
+    ws = connect(client)
+
+    call = asyncio.create_task(client._call_method("slow"))
+    await asyncio.sleep(0)
+    msg_id = methods_sent(ws)[0]["id"]
+
+    # The result arrives after cancel() but before the caller's finally block
+    # has run, so the cancelled future is still registered as pending
+    call.cancel()
+    assert msg_id in client._pending
+    client._handle_message(json.dumps({"msg": "result", "id": msg_id, "result": 1}))
+
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert client._pending == {}
+
+
+def print_request_results(msg):
+    """Answer getPrintRequestsByIds in the method's {toy, request} format."""
+    request_ids = msg["params"][0]["requestIds"]
+    return {
+        "msg": "result",
+        "id": msg["id"],
+        "result": [
+            {
+                "toy": {"_id": f"toy-{rid}", "name": f"Toy {rid}"},
+                "request": {"_id": rid, "state": "done", "end_reason": "completed"},
+            }
+            for rid in reversed(request_ids)
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_print_requests_matches_ids(client):
+    ws = connect(client, print_request_results)
+
+    fetched = await client._fetch_print_requests(["a", "b"])
+
+    assert len(methods_sent(ws)) == 1
+    assert {rid: req.print_name for rid, req in fetched.items()} == {
+        "a": "Toy a",
+        "b": "Toy b",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_print_requests_skips_malformed_entries(client):
+    def reply(msg):
+        response = print_request_results(msg)
+        response["result"].insert(0, None)
+        return response
+
+    connect(client, reply)
+
+    fetched = await client._fetch_print_requests(["a"])
+
+    assert list(fetched) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_data_batches_missing_requests(client):
+    ws = connect(client, print_request_results)
+    feed(client, "added", "PrinterStates", "p1", fields={"last_completed_print": "old"})
+    feed(client, "added", "toyPrints", "cur", fields={
+        "printer_id": "p1", "state": "Printing", "is_active": True,
+    })
+
+    data = await client.get_all_data()
+
+    sent = methods_sent(ws)
+    assert len(sent) == 1
+    assert sorted(sent[0]["params"][0]["requestIds"]) == ["cur", "old"]
+    assert data.last_completed_request.id == "old"
+    assert data.current_request.print_name == "Toy cur"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_all_data_share_one_refresh(client):
+    ws = connect(client, print_request_results)
+    feed(client, "added", "PrinterStates", "p1", fields={"last_completed_print": "old"})
+
+    first, second = await asyncio.gather(client.get_all_data(), client.get_all_data())
+
+    assert first is second
+    assert len(methods_sent(ws)) == 1
+
+    await client.get_all_data()
+    assert len(methods_sent(ws)) == 2
+
+
+@pytest.mark.asyncio
+async def test_close_during_refresh_raises_connection_error(client):
+    connect(client)  # never answers, so the refresh stays in flight
+    feed(client, "added", "PrinterStates", "p1", fields={"last_completed_print": "old"})
+
+    callers = [asyncio.create_task(client.get_all_data()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    await client.close()
+
+    for caller in callers:
+        with pytest.raises(ConnectionError, match="Client closed"):
+            await caller
+    assert client._refresh_task.done()
@@ -15,12 +15,14 @@ async def main():
         lines = f.read().strip().split("\n")
     email, password = lines[0], lines[1]
 
-    client = ToyBoxClient()
+    # Keep every collection the server publishes, not just the ones the
+    # client reads, to see which names it really uses
+    client = ToyBoxClient(track_all_collections=True)
     await client.connect()
     await client.authenticate(email, password)
     await client.setup()
 
-    # Dump ALL collections raw
+    # Dump all collections raw
     for coll_name, docs in client._collections.items():
         print(f"\n{'='*60}")
         print(f"Collection: {coll_name} ({len(docs)} docs)")
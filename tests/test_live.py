@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import sys
+from itertools import islice
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 logging.basicConfig(
@@ -18,6 +19,9 @@ logging.basicConfig(
 )
 
 from toybox_api.client import ToyBoxClient
+from toybox_api.exceptions import AuthenticationError, ToyBoxError
+
+_LOGGER = logging.getLogger("test_live")
 
 
 async def test():
@@ -62,7 +66,7 @@ async def test():
         print("Authenticating...")
         try:
             await client.authenticate(email, password)
-        except Exception:
+        except AuthenticationError:
             # Retry with username-style login
             msg_id = client._next_id()
             future = asyncio.get_event_loop().create_future()
@@ -77,7 +81,8 @@ async def test():
                     ],
                 }
             )
-            result = await asyncio.wait_for(future, timeout=15)
+            async with asyncio.timeout(15):
+                result = await future
             client._login_token = result.get("token")
             client._user_id = result.get("id")
 
@@ -86,8 +91,12 @@ async def test():
         print("Running setup (discover printers, subscribe)...")
         await client.setup()
         print(f"Printer IDs: {client.printer_ids}")
-        print(f"Collections: {list(client._collections.keys())}")
-        for coll_name, docs in client._collections.items():
+        # Collections are created up front, so skip the ones never populated
+        collections = {
+            name: docs for name, docs in client._collections.items() if docs
+        }
+        print(f"Collections: {list(collections)}")
+        for coll_name, docs in collections.items():
             print(f"  {coll_name}: {len(docs)} docs")
 
         data = await client.get_all_data()
@@ -135,7 +144,9 @@ async def test():
 
         print(f"\n=== Raw printerStates ===")
         for doc_id, doc in client._collections.get("printerStates", {}).items():
-            print(json.dumps(doc, indent=2, default=str)[:800])
+            # Only serialize the first fields; the output is truncated anyway
+            head = dict(islice(doc.items(), 20))
+            print(json.dumps(head, indent=2, default=str)[:800])
 
         print(f"\n=== Raw toyPrints ===")
         for doc_id, doc in client._collections.get("toyPrints", {}).items():
@@ -156,13 +167,16 @@ async def test():
             }
             print(json.dumps(filtered, indent=2, default=str)[:600])
 
-    except Exception:
-        import traceback
-
-        traceback.print_exc()
+    except ToyBoxError:
+        _LOGGER.exception("Live test failed")
     finally:
         await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(test())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test())
+    else:
+        uvloop.run(test())
@@ -14,14 +14,26 @@ DDP message format:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import uuid
 from typing import Any
 
 import aiohttp
 
+try:
+    # orjson is an optional speedup for the DDP hot path (the "speedups" extra)
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj: Any) -> str:
+        return _orjson_dumps(obj).decode()
+
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 from .const import (
+    COLLECTIONS_PRINTER_STATES,
+    COLLECTIONS_PRINT_REQUESTS,
+    COLLECTION_LOGIN_SERVICE_CONFIG,
+    COLLECTION_USERS,
     DDP_URL,
     DDP_CONNECT_TIMEOUT,
     DEFAULT_TIMEOUT,
@@ -35,10 +47,32 @@ from .exceptions import (
     APIError,
     SessionExpiredError,
 )
-from .models import PrinterStatus, PrintRequest, ToyBoxData, PrintState
+from .models import PrinterStatus, PrintRequest, ToyBoxData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pre-serialized reply to DDP keep-alive pings
+_PONG_FRAME = '{"msg":"pong"}'
+
+# aiohttp websocket message types that carry a DDP frame / end the connection
+_WS_DATA_TYPES = frozenset({aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY})
+_WS_CLOSE_TYPES = frozenset({
+    aiohttp.WSMsgType.CLOSE,
+    aiohttp.WSMsgType.CLOSING,
+    aiohttp.WSMsgType.CLOSED,
+    aiohttp.WSMsgType.ERROR,
+})
+
+# Collections we read from, created up front. Documents for any other
+# collection the server publishes are dropped unless the client was created
+# with track_all_collections=True.
+_TRACKED_COLLECTIONS = frozenset({
+    *COLLECTIONS_PRINTER_STATES,
+    *COLLECTIONS_PRINT_REQUESTS,
+    COLLECTION_USERS,
+    COLLECTION_LOGIN_SERVICE_CONFIG,
+})
+
 
 class ToyBoxClient:
     """Async client for the ToyBox 3D printer API via Meteor DDP."""
@@ -46,9 +80,18 @@ class ToyBoxClient:
     def __init__(
         self,
         session: aiohttp.ClientSession | None = None,
+        track_all_collections: bool = False,
     ) -> None:
-        """Initialize the client."""
+        """Initialize the client.
+
+        Args:
+            session: aiohttp session to use; one is created if omitted.
+            track_all_collections: Keep documents from every collection the
+                server publishes, not just the ones the client reads
+                (useful for discovering collection names while debugging).
+        """
         self._session = session
+        self._track_all_collections = track_all_collections
         self._owns_session = session is None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._msg_id = 0
@@ -57,25 +100,62 @@ class ToyBoxClient:
         self._email: str | None = None
         self._password: str | None = None
         self._connected = False
+        # Set when the server acknowledges the DDP handshake
+        self._connected_event = asyncio.Event()
         self._printer_ids: list[str] = []
         self._subscribed = False
 
         # DDP collections — populated by subscription messages
-        self._collections: dict[str, dict[str, dict]] = {}
+        self._collections: dict[str, dict[str, dict]] = {
+            name: {} for name in _TRACKED_COLLECTIONS
+        }
+        # Print request documents indexed by printer_id (same dict objects as
+        # in _collections), so per-printer lookups don't scan every print
+        self._prints_by_printer: dict[str | None, dict[str, dict]] = {}
+        # Which spelling of the printer-state / print-request collection the
+        # server actually publishes, resolved on the first document received
+        self._printer_states_key: str | None = None
+        self._print_requests_key: str | None = None
+        # Parsed models per document id, dropped whenever the document changes
+        self._printer_status_cache: dict[str, PrinterStatus] = {}
+        self._print_request_cache: dict[str, PrintRequest] = {}
         # Pending responses for method calls
         self._pending: dict[str, asyncio.Future] = {}
         # Pending subscription ready signals
         self._pending_subs: dict[str, asyncio.Future] = {}
+        # Event loop the connection runs on, cached by connect()
+        self._loop: asyncio.AbstractEventLoop | None = None
         # Background task for receiving DDP messages
         self._recv_task: asyncio.Task | None = None
+        # In-flight get_all_data() refresh, shared by concurrent callers
+        self._refresh_task: asyncio.Task | None = None
+        # Most recent pong send (kept referenced so it isn't garbage collected)
+        self._pong_task: asyncio.Task | None = None
         # Lock to prevent concurrent reconnection attempts
         self._reconnect_lock = asyncio.Lock()
+        # DDP message type -> handler, built once
+        self._handlers = {
+            "added": self._on_added,
+            "changed": self._on_changed,
+            "removed": self._on_removed,
+            "result": self._on_result,
+            "ready": self._on_ready,
+            "nosub": self._on_nosub,
+            "connected": self._on_connected,
+            "ping": self._on_ping,
+        }
 
     def _next_id(self) -> str:
         """Generate a unique message ID."""
         self._msg_id += 1
         return str(self._msg_id)
 
+    def _create_future(self) -> asyncio.Future:
+        """Create a future on the event loop cached by connect()."""
+        if self._loop is None:
+            raise ConnectionError("Not connected")
+        return self._loop.create_future()
+
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
         if self._session is None or self._session.closed:
@@ -89,87 +169,169 @@ class ToyBoxClient:
         """Send a DDP message over WebSocket."""
         if not self._ws or self._ws.closed:
             raise ConnectionError("WebSocket not connected")
-        await self._ws.send_json(msg)
+        # DDP frames must be TEXT, so the serialized bytes are sent as a str
+        await self._ws.send_str(_json_dumps(msg))
 
     async def _recv_loop(self) -> None:
         """Background task to receive and dispatch DDP messages."""
         if not self._ws:
             return
+        # Bound once: this loop runs for every frame
+        receive = self._ws.receive
+        handle = self._handle_message
         try:
-            async for ws_msg in self._ws:
-                if ws_msg.type == aiohttp.WSMsgType.TEXT:
-                    self._handle_message(ws_msg.data)
-                elif ws_msg.type in (
-                    aiohttp.WSMsgType.CLOSED,
-                    aiohttp.WSMsgType.ERROR,
-                ):
+            while True:
+                ws_msg = await receive()
+                msg_type = ws_msg.type
+                # The frame payload is handed to the JSON parser as-is (str for
+                # TEXT, bytes for BINARY) — no extra encode/decode pass.
+                if msg_type in _WS_DATA_TYPES:
+                    handle(ws_msg.data)
+                elif msg_type in _WS_CLOSE_TYPES:
                     break
         except Exception as err:
             _LOGGER.debug("DDP recv loop ended: %s", err)
         finally:
             self._connected = False
+            self._connected_event.clear()
 
-    def _handle_message(self, raw: str) -> None:
+    def _handle_message(self, raw: str | bytes) -> None:
         """Handle an incoming DDP message."""
         try:
-            msg = json.loads(raw)
-        except json.JSONDecodeError:
+            msg = _json_loads(raw)
+        except ValueError:
             return
 
-        msg_type = msg.get("msg")
-
-        if msg_type == "ping":
-            # Respond to keep-alive pings
-            asyncio.ensure_future(self._send({"msg": "pong"}))
-
-        elif msg_type == "added":
-            # Document added to a collection
-            collection = msg.get("collection", "")
-            doc_id = msg.get("id", "")
-            fields = msg.get("fields", {})
-            fields["_id"] = doc_id
-            self._collections.setdefault(collection, {})[doc_id] = fields
-
-        elif msg_type == "changed":
-            # Document updated in a collection
-            collection = msg.get("collection", "")
-            doc_id = msg.get("id", "")
-            fields = msg.get("fields", {})
-            cleared = msg.get("cleared", [])
-            if collection in self._collections and doc_id in self._collections[collection]:
-                doc = self._collections[collection][doc_id]
-                doc.update(fields)
-                for key in cleared:
-                    doc.pop(key, None)
-
-        elif msg_type == "removed":
-            # Document removed from a collection
-            collection = msg.get("collection", "")
-            doc_id = msg.get("id", "")
-            if collection in self._collections:
-                self._collections[collection].pop(doc_id, None)
-
-        elif msg_type == "result":
-            # Method call result
-            msg_id = msg.get("id")
-            if msg_id and msg_id in self._pending:
-                future = self._pending.pop(msg_id)
-                if "error" in msg:
-                    future.set_exception(APIError(str(msg["error"])))
-                else:
-                    future.set_result(msg.get("result"))
+        handler = self._handlers.get(msg.get("msg"))
+        if handler is not None:
+            handler(msg)
+
+    def _on_ping(self, msg: dict) -> None:
+        """Respond to keep-alive pings.
 
-        elif msg_type == "ready":
-            # Subscription ready — resolve any pending futures
-            for sub_id in msg.get("subs", []):
-                if sub_id in self._pending_subs:
-                    future = self._pending_subs.pop(sub_id)
-                    if not future.done():
-                        future.set_result(True)
-            _LOGGER.debug("Subscriptions ready: %s", msg.get("subs"))
+        A pong still in flight already answers an id-less ping, so those are
+        coalesced into the pending send instead of scheduling another task.
+        """
+        if not self._ws or self._ws.closed:
+            return
+        if "id" in msg:
+            # DDP requires the pong to echo the ping's id
+            frame = _json_dumps({"msg": "pong", "id": msg["id"]})
+        elif self._pong_task is None or self._pong_task.done():
+            frame = _PONG_FRAME
+        else:
+            return
+        self._pong_task = asyncio.create_task(self._ws.send_str(frame))
+
+    def _on_added(self, msg: dict) -> None:
+        """Document added to a collection."""
+        collection = msg.get("collection", "")
+        docs = self._collections.get(collection)
+        if docs is None:
+            if not self._track_all_collections:
+                return
+            docs = self._collections[collection] = {}
+        doc_id = msg.get("id", "")
+        fields = msg.get("fields", {})
+        fields["_id"] = doc_id
+        docs[doc_id] = fields
+        self._invalidate_model(collection, doc_id)
+        if collection in COLLECTIONS_PRINT_REQUESTS:
+            if self._print_requests_key is None:
+                self._print_requests_key = collection
+            # Only the resolved collection is indexed, so per-printer lookups
+            # see the same documents as get_print_requests() without a printer
+            if collection == self._print_requests_key:
+                self._prints_by_printer.setdefault(fields.get("printer_id"), {})[doc_id] = fields
+        elif collection in COLLECTIONS_PRINTER_STATES and self._printer_states_key is None:
+            self._printer_states_key = collection
+
+    def _on_changed(self, msg: dict) -> None:
+        """Document updated in a collection.
+
+        Dropped collections never get an entry in _collections, so their
+        changed/removed messages fall through the lookup below.
+        """
+        collection = msg.get("collection", "")
+        doc_id = msg.get("id", "")
+        docs = self._collections.get(collection)
+        doc = docs.get(doc_id) if docs else None
+        if doc is not None:
+            self._invalidate_model(collection, doc_id)
+            printer_id = doc.get("printer_id")
+            fields = msg.get("fields")
+            if fields:
+                doc.update(fields)
+            for key in msg.get("cleared", ()):
+                doc.pop(key, None)
+            if (
+                collection == self._print_requests_key
+                and doc.get("printer_id") != printer_id
+            ):
+                self._unindex_print(printer_id, doc_id)
+                self._prints_by_printer.setdefault(doc.get("printer_id"), {})[doc_id] = doc
+
+    def _on_removed(self, msg: dict) -> None:
+        """Document removed from a collection."""
+        collection = msg.get("collection", "")
+        doc_id = msg.get("id", "")
+        docs = self._collections.get(collection)
+        doc = docs.pop(doc_id, None) if docs else None
+        if doc is not None:
+            self._invalidate_model(collection, doc_id)
+            if collection == self._print_requests_key:
+                self._unindex_print(doc.get("printer_id"), doc_id)
+
+    def _invalidate_model(self, collection: str, doc_id: str) -> None:
+        """Forget the cached model parsed from a document that just changed."""
+        if collection in COLLECTIONS_PRINTER_STATES:
+            self._printer_status_cache.pop(doc_id, None)
+        elif collection in COLLECTIONS_PRINT_REQUESTS:
+            self._print_request_cache.pop(doc_id, None)
+
+    def _unindex_print(self, printer_id: str | None, doc_id: str) -> None:
+        """Drop a print request from the per-printer index."""
+        prints = self._prints_by_printer.get(printer_id)
+        if prints is not None:
+            prints.pop(doc_id, None)
+            if not prints:
+                del self._prints_by_printer[printer_id]
+
+    def _on_result(self, msg: dict) -> None:
+        """Method call result (ids are strings: Meteor rejects any other type)."""
+        future = self._pending.pop(msg.get("id"), None)
+        # The caller may have been cancelled; resolving a done future would
+        # raise InvalidStateError and take the receive loop down with it
+        if future is not None and not future.done():
+            if "error" in msg:
+                future.set_exception(APIError(str(msg["error"])))
+            else:
+                future.set_result(msg.get("result"))
+
+    def _on_ready(self, msg: dict) -> None:
+        """Subscription ready — resolve any pending futures."""
+        for sub_id in msg.get("subs", []):
+            if sub_id in self._pending_subs:
+                future = self._pending_subs.pop(sub_id)
+                if not future.done():
+                    future.set_result(True)
+        _LOGGER.debug("Subscriptions ready: %s", msg.get("subs"))
+
+    def _on_nosub(self, msg: dict) -> None:
+        """Subscription rejected (or stopped).
+
+        Releases the waiter right away instead of letting it run into the timeout.
+        """
+        future = self._pending_subs.pop(msg.get("id"), None)
+        if future and not future.done():
+            future.set_result(False)
+        if "error" in msg:
+            _LOGGER.debug("Subscription %s error: %s", msg.get("id"), msg["error"])
 
-        elif msg_type == "connected":
-            self._connected = True
+    def _on_connected(self, msg: dict) -> None:
+        """DDP handshake acknowledged."""
+        self._connected = True
+        self._connected_event.set()
 
     async def connect(self) -> None:
         """Establish DDP WebSocket connection."""
@@ -178,11 +340,17 @@ class ToyBoxClient:
             self._ws = await session.ws_connect(
                 DDP_URL,
                 timeout=DDP_CONNECT_TIMEOUT,
+                # DDP frames are small JSON; permessage-deflate costs more CPU
+                # than it saves in bandwidth
+                compress=0,
             )
         except aiohttp.ClientError as err:
             raise ConnectionError(f"Cannot connect to make.toys: {err}") from err
 
+        self._loop = asyncio.get_running_loop()
+
         # Start receive loop
+        self._connected_event.clear()
         self._recv_task = asyncio.create_task(self._recv_loop())
 
         # Send DDP connect message
@@ -193,11 +361,10 @@ class ToyBoxClient:
         })
 
         # Wait for connected response
-        for _ in range(50):  # 5 seconds max
-            if self._connected:
-                break
-            await asyncio.sleep(0.1)
-        else:
+        try:
+            async with asyncio.timeout(DDP_CONNECT_TIMEOUT):
+                await self._connected_event.wait()
+        except asyncio.TimeoutError:
             raise ConnectionError("DDP connection handshake timed out")
 
     async def authenticate(self, email: str, password: str) -> bool:
@@ -224,18 +391,18 @@ class ToyBoxClient:
         last_error = None
         for params in login_attempts:
             msg_id = self._next_id()
-            future: asyncio.Future = asyncio.get_event_loop().create_future()
+            future: asyncio.Future = self._create_future()
             self._pending[msg_id] = future
 
-            await self._send({
-                "msg": "method",
-                "method": "login",
-                "id": msg_id,
-                "params": [params],
-            })
-
             try:
-                result = await asyncio.wait_for(future, timeout=DEFAULT_TIMEOUT)
+                await self._send({
+                    "msg": "method",
+                    "method": "login",
+                    "id": msg_id,
+                    "params": [params],
+                })
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    result = await future
             except asyncio.TimeoutError:
                 raise ConnectionError("Login timed out")
             except APIError as err:
@@ -245,6 +412,8 @@ class ToyBoxClient:
                 if "403" in str(err) or "Incorrect" in str(err):
                     raise AuthenticationError("Invalid email or password") from err
                 raise
+            finally:
+                self._pending.pop(msg_id, None)
 
             if isinstance(result, dict) and result.get("token"):
                 self._login_token = result.get("token")
@@ -262,21 +431,23 @@ class ToyBoxClient:
             raise ConnectionError("Not connected")
 
         msg_id = self._next_id()
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        future: asyncio.Future = self._create_future()
         self._pending[msg_id] = future
 
-        await self._send({
-            "msg": "method",
-            "method": method,
-            "id": msg_id,
-            "params": params or [],
-        })
-
         try:
-            return await asyncio.wait_for(future, timeout=DEFAULT_TIMEOUT)
+            await self._send({
+                "msg": "method",
+                "method": method,
+                "id": msg_id,
+                "params": params or [],
+            })
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                return await future
         except asyncio.TimeoutError:
-            self._pending.pop(msg_id, None)
             raise ConnectionError(f"Method {method} timed out")
+        finally:
+            # Also covers cancellation: a late result must not find this future
+            self._pending.pop(msg_id, None)
 
     async def subscribe(self, name: str, params: list | None = None, wait: bool = False) -> str:
         """Subscribe to a Meteor publication.
@@ -284,12 +455,13 @@ class ToyBoxClient:
         Args:
             name: Subscription name.
             params: Subscription parameters.
-            wait: If True, block until the subscription signals "ready".
+            wait: If True, block until the subscription signals "ready" (or
+                the server rejects it with "nosub").
         """
         sub_id = self._next_id()
 
         if wait:
-            future: asyncio.Future = asyncio.get_event_loop().create_future()
+            future: asyncio.Future = self._create_future()
             self._pending_subs[sub_id] = future
 
         await self._send({
@@ -301,10 +473,15 @@ class ToyBoxClient:
 
         if wait:
             try:
-                await asyncio.wait_for(future, timeout=DEFAULT_TIMEOUT)
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    ready = await future
             except asyncio.TimeoutError:
-                self._pending_subs.pop(sub_id, None)
                 _LOGGER.warning("Subscription %s timed out waiting for ready", name)
+            else:
+                if not ready:
+                    _LOGGER.warning("Subscription %s was rejected by the server", name)
+            finally:
+                self._pending_subs.pop(sub_id, None)
 
         return sub_id
 
@@ -339,12 +516,12 @@ class ToyBoxClient:
         - user.printers (array of {id: "..."} objects)
         - user.profile.printer_id (single printer fallback)
         """
-        users = self._collections.get("users", {})
+        users = self._collections.get(COLLECTION_USERS, {})
         user_data = users.get(self._user_id, {}) if self._user_id else {}
 
         if not user_data:
             # Try Meteor.users collection name variant
-            users = self._collections.get("meteor_accounts_loginServiceConfiguration", {})
+            users = self._collections.get(COLLECTION_LOGIN_SERVICE_CONFIG, {})
             user_data = users.get(self._user_id, {}) if self._user_id else {}
 
         printer_ids = []
@@ -378,44 +555,57 @@ class ToyBoxClient:
         This mirrors what the make.toys web app does in PrinterContext.tsx:
         - subscribe("multi_printer_data", printerArray)
         - subscribe("user_printer_requests_all_printers", printerArray)
+
+        Both subscriptions are sent back-to-back and their "ready" signals are
+        awaited together, so setup costs one round-trip instead of two.
         """
         printer_array = [{"id": pid} for pid in printer_ids]
-        await self.subscribe(SUB_MULTI_PRINTER_DATA, [printer_array], wait=True)
-        await self.subscribe(SUB_PRINTER_REQUESTS, [printer_array], wait=True)
+        await asyncio.gather(
+            self.subscribe(SUB_MULTI_PRINTER_DATA, [printer_array], wait=True),
+            self.subscribe(SUB_PRINTER_REQUESTS, [printer_array], wait=True),
+        )
 
     def get_printer_status(self, printer_id: str | None = None) -> PrinterStatus | None:
         """Get printer status from the local PrinterStates collection."""
-        # Server uses "PrinterStates" (capital P/S)
-        printers = self._collections.get("PrinterStates", {})
-        if not printers:
-            printers = self._collections.get("printerStates", {})
-        if not printers:
+        if self._printer_states_key is None:
             return None
+        printers = self._collections[self._printer_states_key]
 
         if printer_id:
             data = printers.get(printer_id)
-            return PrinterStatus.from_dict(data) if data else None
+            return self._parse_printer_status(data) if data else None
 
         # Return the first printer found
         for data in printers.values():
-            return PrinterStatus.from_dict(data)
+            return self._parse_printer_status(data)
         return None
 
+    def _parse_printer_status(self, data: dict) -> PrinterStatus:
+        """Build a PrinterStatus from a document, reusing the cached one if unchanged."""
+        doc_id = data.get("_id", "")
+        status = self._printer_status_cache.get(doc_id)
+        if status is None:
+            status = self._printer_status_cache[doc_id] = PrinterStatus.from_dict(data)
+        return status
+
+    def _parse_print_request(self, data: dict) -> PrintRequest:
+        """Build a PrintRequest from a document, reusing the cached one if unchanged."""
+        doc_id = data.get("_id", "")
+        request = self._print_request_cache.get(doc_id)
+        if request is None:
+            request = self._print_request_cache[doc_id] = PrintRequest.from_dict(data)
+        return request
+
     def get_print_requests(self, printer_id: str | None = None) -> list[PrintRequest]:
         """Get print requests from the local ToyPrints collection."""
-        # Try multiple possible collection names
-        requests = self._collections.get("toyPrints", {})
-        if not requests:
-            requests = self._collections.get("ToyPrints", {})
-        if not requests:
-            requests = self._collections.get("printRequests", {})
-        result = []
-        for data in requests.values():
-            req = PrintRequest.from_dict(data)
-            if printer_id and req.printer_id != printer_id:
-                continue
-            result.append(req)
-        return result
+        if printer_id:
+            # Only this printer's documents, via the index kept by the DDP handlers
+            docs = self._prints_by_printer.get(printer_id, {})
+        elif self._print_requests_key is not None:
+            docs = self._collections[self._print_requests_key]
+        else:
+            docs = {}
+        return [self._parse_print_request(data) for data in docs.values()]
 
     async def get_print_request_details(self, request_ids: list[str]) -> list[dict]:
         """Call getPrintRequestsByIds for detailed print request data."""
@@ -427,13 +617,47 @@ class ToyBoxClient:
         )
         return result if isinstance(result, list) else []
 
+    async def _fetch_print_requests(self, request_ids: list[str]) -> dict[str, PrintRequest]:
+        """Fetch print requests in one method call, keyed by request ID.
+
+        Entries that are not objects are skipped. Returns an empty dict if the
+        call or parsing its result fails.
+        """
+        try:
+            details = await self.get_print_request_details(request_ids)
+            fetched = [
+                PrintRequest.from_dict(detail)
+                for detail in details
+                if isinstance(detail, dict)
+            ]
+        except Exception:
+            _LOGGER.debug("Failed to fetch print requests %s", request_ids)
+            return {}
+        return {req.id: req for req in fetched}
+
     async def get_all_data(self) -> ToyBoxData:
         """Fetch all printer data from DDP collections.
 
         This reads from the locally-synced Meteor collections that are
         populated by our subscriptions. If the connection has dropped,
         it will attempt to reconnect.
+
+        Concurrent callers share a single in-flight refresh.
         """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._get_all_data())
+        refresh = self._refresh_task
+        try:
+            # Shielded so one caller being cancelled doesn't cancel the others
+            return await asyncio.shield(refresh)
+        except asyncio.CancelledError:
+            # The shared refresh was cancelled by close(), not this caller
+            if refresh.cancelled() and not asyncio.current_task().cancelling():
+                raise ConnectionError("Client closed") from None
+            raise
+
+    async def _get_all_data(self) -> ToyBoxData:
+        """Build a ToyBoxData snapshot (see get_all_data)."""
         # Reconnect if the WebSocket has dropped
         if not self._connected or (self._ws and self._ws.closed):
             await self._reconnect()
@@ -468,35 +692,33 @@ class ToyBoxClient:
         last_print_id = printer.last_completed_print
         if not last_print_id:
             # Check user profile for last_completed_print
-            users = self._collections.get("users", {})
+            users = self._collections.get(COLLECTION_USERS, {})
             user_data = users.get(self._user_id, {}) if self._user_id else {}
             profile = user_data.get("profile", {})
             if isinstance(profile, dict):
                 last_print_id = profile.get("last_completed_print")
 
         if not last_completed and last_print_id:
-            for req in requests:
-                if req.id == last_print_id:
-                    last_completed = req
-                    break
+            last_completed = next(
+                (req for req in requests if req.id == last_print_id), None
+            )
 
-            # If still not found, fetch via method call
-            if not last_completed:
-                try:
-                    details = await self.get_print_request_details([last_print_id])
-                    if details:
-                        last_completed = PrintRequest.from_dict(details[0])
-                except Exception:
-                    _LOGGER.debug("Failed to fetch last completed print %s", last_print_id)
-
-        # Enrich current request with print name if missing
-        if current_request and not current_request.print_name:
-            try:
-                details = await self.get_print_request_details([current_request.id])
-                if details:
-                    current_request = PrintRequest.from_dict(details[0])
-            except Exception:
-                _LOGGER.debug("Failed to fetch current print details %s", current_request.id)
+        # If still not found, fetch via method call; likewise enrich the current
+        # request with its print name if missing. getPrintRequestsByIds takes a
+        # list, so both lookups share a single round-trip.
+        missing_last = last_print_id if not last_completed else None
+        missing_current = (
+            current_request.id
+            if current_request and not current_request.print_name
+            else None
+        )
+        missing = [rid for rid in (missing_last, missing_current) if rid]
+        if missing:
+            fetched = await self._fetch_print_requests(missing)
+            if missing_last in fetched:
+                last_completed = fetched[missing_last]
+            if missing_current in fetched:
+                current_request = fetched[missing_current]
 
         return ToyBoxData(
             printer=printer,
@@ -529,8 +751,14 @@ class ToyBoxClient:
                 await self._ws.close()
 
             self._connected = False
+            self._connected_event.clear()
             self._subscribed = False
-            self._collections.clear()
+            self._collections = {name: {} for name in _TRACKED_COLLECTIONS}
+            self._prints_by_printer.clear()
+            self._printer_states_key = None
+            self._print_requests_key = None
+            self._printer_status_cache.clear()
+            self._print_request_cache.clear()
 
             # Reconnect
             try:
@@ -562,20 +790,22 @@ class ToyBoxClient:
     async def _login_with_token(self) -> None:
         """Re-authenticate using a stored Meteor login token."""
         msg_id = self._next_id()
-        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        future: asyncio.Future = self._create_future()
         self._pending[msg_id] = future
 
-        await self._send({
-            "msg": "method",
-            "method": "login",
-            "id": msg_id,
-            "params": [{"resume": self._login_token}],
-        })
-
         try:
-            result = await asyncio.wait_for(future, timeout=DEFAULT_TIMEOUT)
+            await self._send({
+                "msg": "method",
+                "method": "login",
+                "id": msg_id,
+                "params": [{"resume": self._login_token}],
+            })
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                result = await future
         except asyncio.TimeoutError:
             raise ConnectionError("Token login timed out")
+        finally:
+            self._pending.pop(msg_id, None)
 
         if isinstance(result, dict) and result.get("token"):
             self._login_token = result["token"]
@@ -585,6 +815,13 @@ class ToyBoxClient:
 
     async def close(self) -> None:
         """Close the client."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+
         if self._recv_task and not self._recv_task.done():
             self._recv_task.cancel()
             try:
@@ -599,6 +836,7 @@ class ToyBoxClient:
             await self._session.close()
 
         self._connected = False
+        self._connected_event.clear()
 
     async def __aenter__(self) -> ToyBoxClient:
         """Enter async context."""
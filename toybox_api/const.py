@@ -9,6 +9,12 @@ SUB_PRINTER_REQUESTS = "user_printer_requests_all_printers"
 SUB_USER_DATA = "user-data-small"
 SUB_PRINTER_QUEUES = "printerQueues"
 
+# Meteor DDP collections (the server has used more than one spelling)
+COLLECTIONS_PRINTER_STATES = ("PrinterStates", "printerStates")
+COLLECTIONS_PRINT_REQUESTS = ("toyPrints", "ToyPrints", "printRequests")
+COLLECTION_USERS = "users"
+COLLECTION_LOGIN_SERVICE_CONFIG = "meteor_accounts_loginServiceConfiguration"
+
 # Meteor DDP methods
 METHOD_GET_PRINT_REQUESTS = "getPrintRequestsByIds"
 METHOD_GET_PRINTER_PROFILES = "getPrinterProfiles"
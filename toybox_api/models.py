@@ -8,7 +8,7 @@ JavaScript bundle:
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import StrEnum
 from datetime import datetime, timezone
 
@@ -66,7 +66,7 @@ class PrintState(StrEnum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivePrintModel:
     """The model/toy currently being printed (blackbox object from API)."""
     id: str | None = None
@@ -90,7 +90,7 @@ class ActivePrintModel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintRequest:
     """A print request from the ToyPrints collection.
 
@@ -114,6 +114,13 @@ class PrintRequest:
     is_hidden: bool = False
     created_at: datetime | None = None
 
+    def __post_init__(self) -> None:
+        """Treat naive datetimes as UTC, so the timing properties can subtract directly."""
+        self.print_start_time = _as_utc(self.print_start_time)
+        self.print_completion_time = _as_utc(self.print_completion_time)
+        self.pause_start_time = _as_utc(self.pause_start_time)
+        self.created_at = _as_utc(self.created_at)
+
     @classmethod
     def from_dict(cls, data: dict) -> PrintRequest:
         """Parse from a DDP collection document or getPrintRequestsByIds result.
@@ -164,25 +171,11 @@ class PrintRequest:
     @property
     def simplified_state(self) -> PrintState:
         """Map the raw request state to a simplified state for HA display."""
-        match self.state:
-            case PrintRequestState.PRINTING:
-                return PrintState.PRINTING
-            case PrintRequestState.HEATING_UP:
-                return PrintState.HEATING
-            case PrintRequestState.PAUSED | PrintRequestState.REQUESTED_PAUSE | PrintRequestState.REQUESTED_RESUME:
-                return PrintState.PAUSED
-            case PrintRequestState.REQUESTED_CANCEL:
-                return PrintState.CANCELLING
-            case PrintRequestState.CANCELLED:
-                return PrintState.CANCELLED
-            case PrintRequestState.DONE:
-                if self.end_reason == "completed":
-                    return PrintState.COMPLETED
-                return PrintState.CANCELLED
-            case PrintRequestState.REQUESTED | PrintRequestState.PREPARING:
-                return PrintState.PRINTING  # about to print
-            case _:
-                return PrintState.UNKNOWN
+        if self.state == PrintRequestState.DONE:
+            if self.end_reason == "completed":
+                return PrintState.COMPLETED
+            return PrintState.CANCELLED
+        return _SIMPLIFIED_STATES.get(self.state, PrintState.UNKNOWN)
 
     @property
     def is_cancelled(self) -> bool:
@@ -216,11 +209,7 @@ class PrintRequest:
         if self.is_paused and self.pause_start_time:
             delta = self.print_completion_time - self.pause_start_time
         else:
-            now = datetime.now(timezone.utc)
-            completion = self.print_completion_time
-            if completion.tzinfo is None:
-                completion = completion.replace(tzinfo=timezone.utc)
-            delta = completion - now
+            delta = self.print_completion_time - datetime.now(timezone.utc)
 
         seconds = int(delta.total_seconds())
         return max(0, seconds)
@@ -231,30 +220,19 @@ class PrintRequest:
         if not self.print_start_time:
             return None
 
-        now = datetime.now(timezone.utc)
         start = self.print_start_time
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
-
         if self.is_paused and self.pause_start_time:
-            pause = self.pause_start_time
-            if pause.tzinfo is None:
-                pause = pause.replace(tzinfo=timezone.utc)
-            return max(0, int((pause - start).total_seconds()))
+            return max(0, int((self.pause_start_time - start).total_seconds()))
 
+        now = datetime.now(timezone.utc)
         return max(0, int((now - start).total_seconds()))
 
     @property
     def total_seconds(self) -> int | None:
         """Total estimated print time in seconds."""
         if self.print_start_time and self.print_completion_time:
-            start = self.print_start_time
-            end = self.print_completion_time
-            if start.tzinfo is None:
-                start = start.replace(tzinfo=timezone.utc)
-            if end.tzinfo is None:
-                end = end.replace(tzinfo=timezone.utc)
-            return max(0, int((end - start).total_seconds()))
+            delta = self.print_completion_time - self.print_start_time
+            return max(0, int(delta.total_seconds()))
         return None
 
     @property
@@ -274,7 +252,7 @@ class PrintRequest:
         return self.clean_name
 
 
-@dataclass
+@dataclass(slots=True)
 class PrinterStatus:
     """Represents a printer from the PrinterStates collection.
 
@@ -292,7 +270,7 @@ class PrinterStatus:
     last_ping: datetime | None = None
     last_completed_print: str | None = None
     calibration_value: int | None = None
-    owners: list[str] = field(default_factory=list)
+    owners: tuple[str, ...] = ()
 
     @classmethod
     def from_dict(cls, data: dict) -> PrinterStatus:
@@ -309,7 +287,7 @@ class PrinterStatus:
             last_ping=_parse_datetime(data.get("last_ping")),
             last_completed_print=data.get("last_completed_print"),
             calibration_value=data.get("calibrationValue"),
-            owners=data.get("owners", []),
+            owners=tuple(data.get("owners") or ()),
         )
 
     @property
@@ -321,7 +299,7 @@ class PrinterStatus:
         return prefix
 
 
-@dataclass
+@dataclass(slots=True)
 class ToyBoxData:
     """Container for all data from the ToyBox API.
 
@@ -335,12 +313,7 @@ class ToyBoxData:
     def is_printing(self) -> bool:
         """Return True if a print is actively running."""
         if self.current_request and self.current_request.is_active:
-            return self.current_request.state in (
-                PrintRequestState.PRINTING,
-                PrintRequestState.HEATING_UP,
-                PrintRequestState.REQUESTED,
-                PrintRequestState.PREPARING,
-            )
+            return self.current_request.state in _PRINTING_STATES
         return False
 
     @property
@@ -356,18 +329,50 @@ class ToyBoxData:
         return PrintState.IDLE
 
 
+# Raw state string -> enum, so parsing unknown states needs no exception handling
+_REQUEST_STATES: dict[str, PrintRequestState] = {s.value: s for s in PrintRequestState}
+
+# Request state -> simplified HA state (DONE depends on end_reason, handled inline)
+_SIMPLIFIED_STATES: dict[PrintRequestState, PrintState] = {
+    PrintRequestState.PRINTING: PrintState.PRINTING,
+    PrintRequestState.HEATING_UP: PrintState.HEATING,
+    PrintRequestState.PAUSED: PrintState.PAUSED,
+    PrintRequestState.REQUESTED_PAUSE: PrintState.PAUSED,
+    PrintRequestState.REQUESTED_RESUME: PrintState.PAUSED,
+    PrintRequestState.REQUESTED_CANCEL: PrintState.CANCELLING,
+    PrintRequestState.CANCELLED: PrintState.CANCELLED,
+    PrintRequestState.REQUESTED: PrintState.PRINTING,  # about to print
+    PrintRequestState.PREPARING: PrintState.PRINTING,  # about to print
+}
+
+# Request states that count as actively printing
+_PRINTING_STATES = frozenset({
+    PrintRequestState.PRINTING,
+    PrintRequestState.HEATING_UP,
+    PrintRequestState.REQUESTED,
+    PrintRequestState.PREPARING,
+})
+
+
 def _parse_request_state(raw: str | None) -> PrintRequestState:
     """Parse a raw state string into a PrintRequestState."""
-    if not raw:
-        return PrintRequestState.UNKNOWN
-    try:
-        return PrintRequestState(raw)
-    except ValueError:
+    if not isinstance(raw, str):
         return PrintRequestState.UNKNOWN
+    return _REQUEST_STATES.get(raw, PrintRequestState.UNKNOWN)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Return a timezone-aware datetime, taking naive values as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
 
 
 def _parse_datetime(raw) -> datetime | None:
-    """Parse a datetime from Meteor (can be Date object, ISO string, or epoch)."""
+    """Parse a datetime from Meteor (can be Date object, ISO string, or epoch).
+
+    Always returns a timezone-aware datetime (naive values are taken as UTC).
+    """
     if raw is None:
         return None
     # Meteor sends dates as {"$date": epoch_ms} in DDP, or as Date objects
@@ -379,9 +384,11 @@ def _parse_datetime(raw) -> datetime | None:
         return datetime.fromtimestamp(raw, tz=timezone.utc)
     if isinstance(raw, str):
         try:
-            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            parsed = datetime.fromisoformat(raw)  # 3.11+ accepts a trailing "Z"
         except ValueError:
             return None
-    if isinstance(raw, datetime):
-        return raw
-    return None
+    elif isinstance(raw, datetime):
+        parsed = raw
+    else:
+        return None
+    return _as_utc(parsed)